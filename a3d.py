@@ -20,14 +20,15 @@ import subprocess
 
 def _ensure_dependencies():
     """Detect missing packages and offer to pip-install them, so a user can just
-    run the script. requests/bs4/psutil are required; hidapi (controller) and
+    run the script. requests/psutil are required; hidapi (controller) and
     pillow (custom artwork) are optional."""
     if getattr(sys, "frozen", False):
         return  # packaged binary (PyInstaller) - dependencies are bundled in
 
-    required = [("requests", "requests"), ("bs4", "beautifulsoup4"), ("psutil", "psutil")]
+    required = [("requests", "requests"), ("psutil", "psutil")]
     optional = [("hid", "hidapi"), ("PIL", "pillow"),
-                ("rich", "rich"), ("questionary", "questionary")]
+                ("rich", "rich"), ("questionary", "questionary"),
+                ("zlib_ng", "zlib-ng")]
 
     def missing(items):
         out = []
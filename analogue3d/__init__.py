@@ -5,4 +5,17 @@ import-light (this __init__ pulls in nothing heavy) so the launcher can bootstra
 dependencies before any submodule imports requests/psutil/etc.
 """
 
+import sys
+
 __version__ = "0.7.0"
+
+# Optional speedup: route ``import zlib`` to zlib-ng when it's installed.
+# zlib-ng is a drop-in zlib with SIMD deflate and hardware CRC32 (PCLMULQDQ /
+# SSE4.2 / ARMv8), 2-3x faster on the paths we care about: zipfile's CRC32 in
+# SD backups and the cart-ID CRC32 in labels. setdefault so an already-imported
+# stock zlib is left alone; without zlib-ng everything behaves identically.
+try:
+    from zlib_ng import zlib_ng as _zlib_ng
+    sys.modules.setdefault("zlib", _zlib_ng)
+except ImportError:
+    pass
@@ -5,8 +5,9 @@ available, and a numbered fallback otherwise.
 """
 
 import os
-
-import requests
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
 from . import sdcard, controller, labels, saves, savestates, config, ui, updates, selfupdate
 
@@ -86,13 +87,36 @@ def _auto_all():
         ui.warn("Cancelled.")
         return
 
+    import requests  # deferred: keeps requests off the menu's cold-start path
+
     try:
         sdcard.create_backup(root)
-        if not sdcard.install_firmware(root):
-            ui.warn("Firmware step didn't complete - check your connection.")
-        if not sdcard.install_labels(
-                root, labels.custom_pack_path() if labels.has_custom_pack() else None):
-            ui.warn("Art pack step didn't complete.")
+        # Firmware comes from analogue.co and the art pack from the GitHub
+        # release CDN - independent hosts, so fetch both concurrently and
+        # roughly halve the download wall-clock. The applies stay sequential:
+        # they share the SD card.
+        art_source = labels.custom_pack_path() if labels.has_custom_pack() else None
+        print("\n=== Updating Analogue 3D Firmware + Art Pack ===")
+        tmpdir = tempfile.mkdtemp(prefix="a3d-auto-")
+        try:
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                fw_job = pool.submit(sdcard.fetch_firmware, tmpdir)
+                art_job = pool.submit(sdcard.fetch_labels, tmpdir, art_source)
+                local_fw = fw_job.result()
+                # The art host failing (GitHub CDN blocked, release pulled)
+                # shouldn't cost the firmware update too - it didn't when the
+                # steps ran sequentially.
+                try:
+                    local_art = art_job.result()
+                except (requests.RequestException, OSError) as e:
+                    ui.warn(f"Art pack download failed: {e}")
+                    local_art = None
+            if not (local_fw and sdcard.apply_firmware(local_fw, root)):
+                ui.warn("Firmware step didn't complete - check your connection.")
+            if not (local_art and sdcard.apply_labels(local_art, root)):
+                ui.warn("Art pack step didn't complete.")
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
     except (requests.RequestException, OSError) as e:
         ui.err(f"Auto update stopped during SD tasks: {e}")
         return
@@ -254,7 +278,9 @@ def main():
             elif action == "artpack":
                 _art_pack_flow(root)
             elif action == "backup":
-                sdcard.create_backup(root, ui.text("Label this backup (optional):") or None)
+                sdcard.create_backup(root, ui.text("Label this backup (optional):") or None,
+                                     compress=ui.confirm("Compress this backup? (smaller file, slower)",
+                                                         default=False))
             elif action == "restore":
                 sdcard.restore_backup(root)
             elif action == "saves":
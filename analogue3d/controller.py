@@ -44,7 +44,8 @@ Version encoding: integer == major*100 + minor (203 -> "2.03", 204 -> "2.04").
 import struct
 import time
 
-import requests
+# requests is imported inside the functions that talk to the 8BitDo API, so
+# merely importing this module (every CLI launch) doesn't pay for it.
 
 try:
     import hid  # provided by the `hidapi` pip package
@@ -290,6 +291,7 @@ def fetch_firmware_list(beta=False):
 def _fetch_firmware_list_v2(beta):
     """The Ultimate Software V2 feed. Returns a normalized list, or None on
     any failure so the caller can fall back to the legacy feed."""
+    import requests
     try:
         resp = requests.post(
             FIRMWARE_API_V2,
@@ -311,6 +313,7 @@ def _fetch_firmware_list_v2(beta):
 
 def _fetch_firmware_list_legacy(beta):
     """The legacy dl.8bitdo.com:8080 feed (stale: nothing after 2.04)."""
+    import requests
     headers = {"Type": str(FIRMWARE_TYPE)}
     if beta:
         headers["Beta"] = "1"
@@ -344,6 +347,7 @@ def latest_tested(versions):
 
 
 def download_firmware(meta):
+    import requests
     url = meta.get("download_url") or (FIRMWARE_API_BASE + meta["filePathName"])
     resp = requests.get(url, timeout=60)
     resp.raise_for_status()
@@ -559,6 +563,7 @@ def update_to_latest(progress=None):
     """Non-interactive: flash the newest TESTED firmware if the connected 64 is
     behind it (never an untested release — that requires the interactive menu).
     Returns a short human-readable status string (used by the 'auto' flow)."""
+    import requests
     if hid is None:
         return "skipped (hidapi not installed)"
     if not is_connected():
@@ -600,6 +605,7 @@ def update_all(progress=None, announce=None):
     any controller still on an older version until none remain, re-enumerating
     between flashes because each flash reboots its controller).
     Returns a summary dict: {total, updated, already, failed, note?}."""
+    import requests
     if hid is None:
         return {"total": 0, "updated": 0, "already": 0, "failed": 0, "note": "hidapi not installed"}
     total = connected_count()
@@ -675,6 +681,7 @@ def update_all_to(meta, progress=None, announce=None):
     entry from fetch_firmware_list), allowing downgrades. Flashes any controller
     not already on that exact version, re-enumerating between flashes. Returns the
     same summary dict shape as update_all()."""
+    import requests
     if hid is None:
         return {"total": 0, "updated": 0, "already": 0, "failed": 0, "note": "hidapi not installed"}
     total = connected_count()
@@ -778,6 +785,7 @@ def _select_version(versions, current):
 
 def run_interactive():
     """Menu-callable entry point: detect, pick a version, confirm, flash, verify."""
+    import requests
     print("\n=== Update 8BitDo 64 Controller Firmware ===")
     if hid is None:
         print("The 'hidapi' package is required. Run: pip install hidapi")
@@ -19,7 +19,6 @@ import os
 import re
 import io
 import shutil
-import zipfile
 from datetime import datetime
 
 from . import config, ui
@@ -133,6 +132,7 @@ def archive_all(sd_root, label=None):
     the per-game folder structure inside (so a single game can be restored later).
     An optional label is appended to the filename. Returns (zip_path, n_states);
     (None, 0) if there are no save states."""
+    import zipfile
     games = find_game_states(sd_root)
     total = sum(g["count"] for g in games)
     if total == 0:
@@ -176,6 +176,7 @@ def list_snapshots():
 
 def snapshot_games(name):
     """Per-game breakdown of a snapshot: [{cart_id, title, count}], by title."""
+    import zipfile
     path = _snapshot_path(name)
     games = {}
     if not os.path.isfile(path):
@@ -195,6 +196,7 @@ def snapshot_games(name):
 def restore_snapshot(sd_root, name, cart_id=None):
     """Restore a snapshot back onto the card. If cart_id is given, only that game's
     states are restored; otherwise the whole snapshot. Returns how many were written."""
+    import zipfile
     path = _snapshot_path(name)
     if not os.path.isfile(path):
         raise FileNotFoundError(name)
@@ -4,16 +4,20 @@ cartridge labels, and Library/Settings backup/restore/clean."""
 import os
 import re
 import sys
+import glob
+import json
 import shutil
+import hashlib
+import functools
+import threading
 import tempfile
-import zipfile
 import ctypes
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 from datetime import datetime
 
-import requests
-from bs4 import BeautifulSoup
 import psutil
 
 from .ui import bold, dim, green, yellow, red, ask
@@ -24,6 +28,32 @@ LABELS_DB_URL = "https://github.com/retrogamecorps/Analogue-3D-Images/releases/l
 LABELS_DB_FILENAME = "labels.db"
 ANALOGUE_VOLUME_LABEL = "ANALOGUE 3D"
 
+# One Session for all SD-card HTTP, created lazily on first use: importing
+# requests costs tens of ms of CLI cold-start and the backup/restore paths
+# never touch the network. Keep-alive reuses the analogue.co TLS connection
+# between the info-page GET and the firmware GET (saves a handshake round-
+# trip), and transient network blips get a short retry instead of an
+# immediate abort mid-Auto-flow.
+_SESSION = None
+
+
+def _session():
+    global _SESSION
+    if _SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                                               max_retries=Retry(total=3, backoff_factor=0.3)))
+        _SESSION.headers.update({"Accept-Encoding": "gzip, deflate"})
+    return _SESSION
+
+# The one anchor we need from the firmware page: <a href="...">Download [xx.x MB]</a>.
+# Matching it with a compiled regex (C sre engine) skips building an HTML tree
+# entirely and keeps the scrape dependency-free.
+_DL_RE = re.compile(r'<a[^>]+href="([^"]+)"[^>]*>[^<]*Download \[[^\]]*MB', re.IGNORECASE)
+
 # Known label-database sources. Add more (name, url) as they appear.
 # Default art is the excellent pack maintained by RetroGameCorps.
 LABEL_SOURCES = [
@@ -58,18 +88,53 @@ def choose_label_source():
         return LABEL_SOURCES[0][1]
 
 
+# Firmware-page lookup cache. In-process because the menu re-asks on every
+# "do another operation" loop; on disk (ETag/Last-Modified, same pattern as
+# updates.py's release cache) so the next run can do a conditional GET and get
+# a 304 instead of re-downloading and re-parsing the page.
+_FW_INFO = None
+_FW_CACHE_PATH = os.path.join(os.path.dirname(config.config_path()), "firmware_page.json")
+
+
+def _load_fw_cache():
+    try:
+        with open(_FW_CACHE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_fw_cache(entry):
+    try:
+        os.makedirs(os.path.dirname(_FW_CACHE_PATH), exist_ok=True)
+        with open(_FW_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+    except OSError:
+        pass
+
+
 def get_latest_firmware_url():
+    global _FW_INFO
+    if _FW_INFO is not None:
+        return _FW_INFO
+
     print("Fetching latest firmware info from Analogue...")
-    resp = requests.get(FIRMWARE_PAGE)
+    cached = _load_fw_cache()
+    headers = {}
+    if cached.get("url") and cached.get("filename"):
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    resp = _session().get(FIRMWARE_PAGE, headers=headers)
+    if resp.status_code == 304:  # page unchanged since last run
+        _FW_INFO = (cached["url"], cached["filename"])
+        print(f"Latest firmware: {cached['filename']}")
+        return _FW_INFO
     resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, "html.parser")
-
-    download_link = None
-    for a in soup.find_all("a", href=True):
-        if a.text and "Download [" in a.text and "MB" in a.text:
-            download_link = a["href"]
-            break
+    m = _DL_RE.search(resp.text)
+    download_link = m.group(1) if m else None
 
     if not download_link:
         print("Error: Could not find download link. Site layout may have changed.")
@@ -91,22 +156,155 @@ def get_latest_firmware_url():
         print("Error: Could not parse firmware version from page.")
         return None, None
 
+    _FW_INFO = (download_url, filename)
+    _save_fw_cache({"url": download_url, "filename": filename,
+                    "etag": resp.headers.get("ETag", ""),
+                    "last_modified": resp.headers.get("Last-Modified", "")})
     print(f"Latest firmware: {filename}")
     return download_url, filename
 
+def _advise_sequential(fd, size):
+    """Hint the kernel about a big sequential write: preallocate the blocks
+    (contiguous extents, so a 100 MB firmware doesn't fragment mid-download)
+    and declare sequential access so writeback and readahead tune for it.
+    Purely advisory and POSIX-only - a silent no-op on Windows or when the
+    filesystem declines."""
+    try:
+        if size > 0 and hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, size)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except OSError:
+        pass
+
+
+_RANGE_WORKERS = 4
+_RANGE_MIN_BYTES = 8 * 1024 * 1024  # below this, thread setup costs more than it saves
+
+
+def _fetch_range(url, filepath, start, end):
+    """Fetch bytes start..end (inclusive) of `url` into the same offsets of the
+    pre-sized `filepath`. Each worker opens its own handle, so no locking."""
+    import requests
+    import urllib3
+    r = _session().get(url, headers={"Range": f"bytes={start}-{end}"}, stream=True)
+    r.raise_for_status()
+    if r.status_code != 206:  # server sent the whole file: ranges unsupported
+        raise ValueError("server ignored the Range header")
+    with open(filepath, "r+b") as f:
+        f.seek(start)
+        try:
+            shutil.copyfileobj(r.raw, f, length=1024 * 1024)
+        except urllib3.exceptions.HTTPError as e:
+            # same re-wrap as download_file: raw reads skip iter_content's
+            # exception translation, and the fallback must see a requests error
+            raise requests.ConnectionError(e)
+
+
+def _download_ranged(url, filepath):
+    """Download `url` with 4 parallel Range requests into a pre-sized file.
+
+    CDNs cap per-connection throughput, so splitting the ~100 MB firmware into
+    slices fetched over parallel connections often nearly multiplies the
+    effective rate. Returns True if it handled the transfer; False means the
+    server doesn't support ranges (or the file is small) and the caller should
+    use the plain single-stream path."""
+    import requests
+    import urllib3
+    try:
+        head = _session().head(url, allow_redirects=True)
+        head.raise_for_status()
+    except requests.RequestException:
+        return False
+    total = int(head.headers.get("Content-Length") or 0)
+    if total < _RANGE_MIN_BYTES or head.headers.get("Accept-Ranges", "").lower() != "bytes":
+        return False
+
+    with open(filepath, "wb") as f:
+        f.truncate(total)
+        _advise_sequential(f.fileno(), total)
+    step = -(-total // _RANGE_WORKERS)  # ceil division
+    spans = [(s, min(s + step, total) - 1) for s in range(0, total, step)]
+    try:
+        with ThreadPoolExecutor(max_workers=_RANGE_WORKERS) as pool:
+            for job in [pool.submit(_fetch_range, url, filepath, s, e) for s, e in spans]:
+                job.result()
+    except (requests.RequestException, urllib3.exceptions.HTTPError, ValueError, OSError):
+        return False  # partial file gets overwritten by the serial fallback
+    return True
+
+
+_SHA256_RE = re.compile(r"\b[0-9a-f]{64}\b", re.IGNORECASE)
+
+
+def _sha256_file(filepath):
+    """Streaming SHA-256 of a local file. OpenSSL-backed hashlib picks up the
+    CPU's SHA extensions where present, and the file is still in page cache
+    right after a download - this is effectively free next to the transfer."""
+    h = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _verify_download(url, filepath):
+    """Check `filepath` against a `.sha256` sidecar of `url`, if one exists.
+
+    Returns False only on a definite mismatch (corrupt download - better to
+    fail here than brick a firmware update attempt). When there's no sidecar -
+    Analogue doesn't publish one today - the digest is printed so the user can
+    verify by hand, and the download is accepted."""
+    import requests
+    digest = _sha256_file(filepath)
+    expected = None
+    try:
+        r = _session().get(url + ".sha256", timeout=6)
+        if r.status_code == 200:
+            m = _SHA256_RE.search(r.text)
+            expected = m.group(0).lower() if m else None
+    except requests.RequestException:
+        pass
+    if expected is None:
+        print(dim(f"SHA-256: {digest}"))
+        return True
+    if expected == digest:
+        print(green("SHA-256 verified."))
+        return True
+    print(red(f"SHA-256 mismatch for {os.path.basename(filepath)} - the download is corrupt."))
+    return False
+
+
 def download_file(url, dest_folder=".", filename=None):
     if not filename:
         filename = url.split("/")[-1].split("?")[0]
     filepath = os.path.join(dest_folder, filename)
 
     print(f"Downloading {filename}...")
-    r = requests.get(url, stream=True)
-    r.raise_for_status()
-
-    with open(filepath, "wb") as f:
-        for chunk in r.iter_content(chunk_size=8192):
-            f.write(chunk)
-
+    if not _download_ranged(url, filepath):
+        import requests
+        import urllib3
+        r = _session().get(url, stream=True)
+        r.raise_for_status()
+
+        # Copy in C via copyfileobj rather than a Python-level iter_content loop:
+        # at 8 KiB chunks a 100 MB firmware is ~12,000 interpreter iterations and
+        # as many small write syscalls. 1 MiB chunks cut both by ~128x.
+        r.raw.decode_content = True  # transparently inflate if the server gzips
+        with open(filepath, "wb") as f:
+            _advise_sequential(f.fileno(), int(r.headers.get("Content-Length") or 0))
+            try:
+                shutil.copyfileobj(r.raw, f, length=1024 * 1024)
+            except urllib3.exceptions.HTTPError as e:
+                # Reading r.raw directly skips iter_content's exception
+                # translation, so a connection dropped mid-body surfaces as a
+                # bare urllib3 ProtocolError. Re-wrap it so callers catching
+                # requests.RequestException degrade gracefully, as they did
+                # with the old iter_content loop.
+                raise requests.ConnectionError(e)
+
+    if not _verify_download(url, filepath):
+        raise OSError(f"corrupt download: {filepath}")
     print(f"Downloaded: {filepath}")
     return filepath
 
@@ -156,29 +354,74 @@ def _analogue_signature(mount, label):
     return score, reasons
 
 
+# Filesystems that live on the network. They are never the SD card, and any
+# stat-like call against a dead one (asleep NAS, stale autofs entry) can hang
+# for many seconds - skip them before touching the mount at all.
+_NETWORK_FS = frozenset({"nfs", "nfs4", "cifs", "smbfs", "smb2", "afpfs",
+                         "webdav", "fuse.sshfs", "autofs"})
+
+# SD-card-ish filesystems and external mount prefixes, hoisted to module scope:
+# on hosts with many mounts (autofs, container overlays) the per-partition loop
+# is surprisingly hot, so membership is one frozenset lookup and the path test
+# one compiled-regex match instead of rebuilt tuples each iteration.
+_SDLIKE_FS = frozenset({"fat", "fat32", "exfat", "vfat", "ntfs"})
+_EXT_PATH_RE = re.compile(r"^(/media/|/Volumes/|/mnt/)")
+
+
+@functools.lru_cache(maxsize=1)
+def _disk_partitions():
+    """psutil.disk_partitions(), cached for the process. Enumerating mounts can
+    itself block on dead network/autofs entries, and the CLI re-scans on every
+    menu loop for the status line; rescan_drives() drops the cache."""
+    return list(psutil.disk_partitions(all=False))
+
+
+def rescan_drives():
+    """Forget the cached mount list (e.g. the user just inserted the card)."""
+    _disk_partitions.cache_clear()
+
+
+def _free_gb(mount, timeout=1.0):
+    """Free space on `mount` in GiB, computed in a side thread with a timeout.
+    Returns None if the statvfs doesn't answer in time - the signature of a
+    hung network mount, which we'd rather drop than block the whole scan on."""
+    result = []
+
+    def probe():
+        try:
+            result.append(shutil.disk_usage(mount).free // (1024 ** 3))
+        except OSError:
+            result.append(0)
+
+    t = threading.Thread(target=probe, daemon=True)
+    t.start()
+    t.join(timeout)
+    return result[0] if result else None
+
+
 def get_potential_sd_cards():
     """Return drive dicts, best Analogue-3D candidate first."""
     candidates = []
     seen = set()
-    for part in psutil.disk_partitions():
+    for part in _disk_partitions():
         mount = part.mountpoint
+        fstype = part.fstype.lower()
+        if fstype in _NETWORK_FS:
+            continue
         if not os.access(mount, os.W_OK):
             continue
-        opts = part.opts.lower()
-        fstype = part.fstype.lower()
-        is_removable = "removable" in opts
-        is_sd_like = fstype in ("fat", "fat32", "exfat", "vfat", "ntfs")
-        is_external_path = mount.startswith(("/media/", "/Volumes/", "/mnt/"))
+        is_removable = "removable" in part.opts.lower()
+        is_sd_like = fstype in _SDLIKE_FS
+        is_external_path = _EXT_PATH_RE.match(mount) is not None
         if not (is_removable or is_external_path or is_sd_like):
             continue
         display_path = mount.rstrip(os.sep) + os.sep
         if display_path in seen:
             continue
         seen.add(display_path)
-        try:
-            free_gb = shutil.disk_usage(mount).free // (1024 ** 3)
-        except OSError:
-            free_gb = 0
+        free_gb = _free_gb(mount)
+        if free_gb is None:
+            continue  # hung disk_usage: a dead mount, not an SD card
         label = get_volume_label(mount)
         score, reasons = _analogue_signature(mount, label)
         candidates.append({
@@ -211,7 +454,8 @@ def _manual_path():
 def select_sd_card():
     """Pick the Analogue 3D SD card. Returns a path, or None if the user cancels."""
     print(dim("Scanning for the Analogue 3D SD card..."))
-    drives = get_potential_sd_cards()
+    rescan_drives()  # the card may have just been inserted; only the cheap
+    drives = get_potential_sd_cards()  # status line uses the cached mount list
 
     # Auto-pick when exactly one drive has a strong Analogue 3D signature.
     strong = [d for d in drives if d["score"] >= 4]
@@ -287,113 +531,308 @@ def _readonly_message(path):
     )
 
 
-def install_firmware(target_root):
-    print("\n=== Updating Analogue 3D Firmware ===")
+_DIRECT_ALIGN = 4096                  # O_DIRECT wants sector-aligned sizes/buffers
+_DIRECT_MIN_BYTES = 8 * 1024 * 1024   # only worth bypassing the cache for big files
+
+
+def _copy_unbuffered(src, dst):
+    """Copy `src` to `dst` bypassing the OS write cache, for big firmware files.
+
+    Caching a 100 MB write that must be flushed the moment the user ejects is
+    the worst case of double-buffering on slow SD media. On Linux the
+    destination is opened with O_DIRECT and fed 1 MiB page-aligned chunks from
+    an anonymous mmap (O_DIRECT rejects unaligned user buffers); the unaligned
+    tail is finished with one ordinary buffered write. On macOS, F_NOCACHE on
+    a normal copy achieves the same. Returns True if it handled the copy;
+    False (Windows, or a driver that refuses direct I/O with EINVAL) means the
+    caller should fall back to the buffered path."""
+    if sys.platform == "darwin":
+        import fcntl
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.fcntl(fdst.fileno(), fcntl.F_NOCACHE, 1)
+                shutil.copyfileobj(fsrc, fdst, length=1024 * 1024)
+            return True
+        except OSError:
+            return False
+    if not hasattr(os, "O_DIRECT"):
+        return False
+
+    import mmap
+    try:
+        size = os.path.getsize(src)
+        aligned = size - (size % _DIRECT_ALIGN)
+        fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_DIRECT, 0o644)
+        try:
+            with open(src, "rb") as fsrc, mmap.mmap(-1, 1 << 20) as buf:
+                done = 0
+                view = memoryview(buf)
+                try:
+                    while done < aligned:
+                        n = min(1 << 20, aligned - done)  # stays a 4 KiB multiple
+                        got = 0
+                        while got < n:
+                            r = fsrc.readinto(view[got:n])
+                            if not r:
+                                raise OSError("short read from firmware source")
+                            got += r
+                        # os.write may write less than asked (signal mid-copy,
+                        # near-full media); advancing by n regardless would
+                        # silently corrupt the copy. A short O_DIRECT write that
+                        # lands on an unaligned offset EINVALs on the next call,
+                        # which falls us back to the buffered path that rewrites
+                        # the file from scratch.
+                        written = 0
+                        while written < n:
+                            written += os.write(fd, view[written:n])
+                        done += n
+                finally:
+                    view.release()  # the mmap can't close while views exist
+                tail = fsrc.read()
+        finally:
+            os.close(fd)
+        if tail:
+            with open(dst, "r+b") as fdst:
+                fdst.seek(aligned)
+                fdst.write(tail)
+        return True
+    except OSError:
+        return False
+
+
+def _copy_to_card(src, dst):
+    """Copy `src` over `dst` (both paths). Large files first try the
+    un-buffered direct-I/O path (see _copy_unbuffered). Otherwise on Linux this
+    uses os.sendfile, so the bytes move kernel-side from the page cache to the
+    SD driver instead of bouncing through a 64 KiB user-space read/write loop;
+    macOS and Windows get their native fast paths (fcopyfile / CopyFileW) via
+    shutil.copyfile."""
+    try:
+        big = os.path.getsize(src) >= _DIRECT_MIN_BYTES
+    except OSError:
+        big = False
+    if big and _copy_unbuffered(src, dst):
+        return
+    if sys.platform.startswith("linux") and hasattr(os, "sendfile"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            while remaining > 0:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, remaining)
+                if sent == 0:
+                    break
+                offset += sent
+                remaining -= sent
+        return
+    shutil.copyfile(src, dst)
+
+
+def fetch_firmware(dest_folder):
+    """Download the latest firmware into `dest_folder` (a writable scratch dir).
+    Returns the local file path, or None if the page scrape failed. Split from
+    apply_firmware so the Auto flow can overlap this with the art-pack fetch."""
     fw_url, fw_filename = get_latest_firmware_url()
     if not fw_url:
-        return False
+        return None
+    return download_file(fw_url, dest_folder=dest_folder, filename=fw_filename)
+
+
+def apply_firmware(local_fw_path, target_root):
+    """Copy an already-downloaded firmware onto the SD card root and prune any
+    older a3d_os_*.bin files. Returns True on success."""
+    fw_filename = os.path.basename(local_fw_path)
+    dest_path = os.path.join(target_root, fw_filename)
 
+    print(f"Copying {fw_filename} to SD card root...")
+    try:
+        _copy_to_card(local_fw_path, dest_path)
+    except OSError as e:
+        if _is_readonly_error(e):
+            print(_readonly_message(target_root))
+            return False
+        raise
+
+    print("Removing old firmware files...")
+    removed = 0
+    # iglob streams matches with the name filter done in C (fnmatch), instead of
+    # materializing every SD-root entry - often thousands of ROMs - as a Python
+    # string just to test its prefix/suffix.
+    for old_path in glob.iglob(os.path.join(glob.escape(target_root), "a3d_os_*.bin")):
+        entry = os.path.basename(old_path)
+        if entry == fw_filename:
+            continue
+        try:
+            os.remove(old_path)
+            print(f"  Removed {entry}")
+            removed += 1
+        except OSError:
+            pass
+    if removed == 0:
+        print("  No old firmware files found.")
+    return True
+
+
+def install_firmware(target_root):
+    print("\n=== Updating Analogue 3D Firmware ===")
     # Download to a writable temp dir, not the current working directory. A GUI
     # build launched from /Applications has CWD=/ on macOS (the sealed system
     # volume), where the write would fail with EROFS and abort the Auto flow.
     tmpdir = tempfile.mkdtemp(prefix="a3d-fw-")
     try:
-        local_fw_path = download_file(fw_url, dest_folder=tmpdir, filename=fw_filename)
-        dest_path = os.path.join(target_root, fw_filename)
-
-        print(f"Copying {fw_filename} to SD card root...")
-        try:
-            shutil.copy(local_fw_path, dest_path)
-        except OSError as e:
-            if _is_readonly_error(e):
-                print(_readonly_message(target_root))
-                return False
-            raise
-
-        print("Removing old firmware files...")
-        removed = 0
-        for entry in os.listdir(target_root):
-            if entry.startswith("a3d_os_") and entry.endswith(".bin") and entry != fw_filename:
-                old_path = os.path.join(target_root, entry)
-                try:
-                    os.remove(old_path)
-                    print(f"  Removed {entry}")
-                    removed += 1
-                except OSError:
-                    pass
-        if removed == 0:
-            print("  No old firmware files found.")
+        local_fw_path = fetch_firmware(tmpdir)
+        if not local_fw_path:
+            return False
+        return apply_firmware(local_fw_path, target_root)
     finally:
         shutil.rmtree(tmpdir, ignore_errors=True)
 
+def fetch_labels(dest_folder, source=None):
+    """Resolve an art-pack source to a local labels.db path, downloading into
+    `dest_folder` when the source is a URL. `source` may be a URL or a path to
+    a local labels.db; defaults to the RetroGameCorps pack."""
+    src = source or LABELS_DB_URL
+    if os.path.isfile(src):
+        print(f"Loading art pack from local file: {src}")
+        return src
+    return download_file(src, dest_folder=dest_folder)
+
+
+def apply_labels(local_labels_path, target_root):
+    """Copy a local labels.db into the card's Library/N64/Images folder."""
+    labels_dir = os.path.join(target_root, "Library", "N64", "Images")
+    dest_path = os.path.join(labels_dir, LABELS_DB_FILENAME)
+    print(f"Copying {LABELS_DB_FILENAME} to {labels_dir}/")
+    try:
+        os.makedirs(labels_dir, exist_ok=True)
+        _copy_to_card(local_labels_path, dest_path)
+    except OSError as e:
+        if _is_readonly_error(e):
+            print(_readonly_message(target_root))
+            return False
+        raise
+
+    print(green("Cartridge art pack installed - your cart art will now show."))
     return True
 
+
 def install_labels(target_root, source=None):
     """Install a cartridge art pack (labels.db). `source` may be a URL or a path
     to a local labels.db file you've assembled; defaults to the RetroGameCorps pack."""
     print("\n=== Installing Cartridge Art Pack ===")
-    src = source or LABELS_DB_URL
-    tmpdir = None
+    # Same reasoning as install_firmware: never write to CWD, which on a
+    # /Applications-launched GUI build is the read-only system volume.
+    tmpdir = tempfile.mkdtemp(prefix="a3d-labels-")
     try:
-        if os.path.isfile(src):
-            print(f"Loading art pack from local file: {src}")
-            local_labels_path = src
-        else:
-            # Same reasoning as install_firmware: never write to CWD, which on a
-            # /Applications-launched GUI build is the read-only system volume.
-            tmpdir = tempfile.mkdtemp(prefix="a3d-labels-")
-            local_labels_path = download_file(src, dest_folder=tmpdir)
-
-        labels_dir = os.path.join(target_root, "Library", "N64", "Images")
-        dest_path = os.path.join(labels_dir, LABELS_DB_FILENAME)
-        print(f"Copying {LABELS_DB_FILENAME} to {labels_dir}/")
-        try:
-            os.makedirs(labels_dir, exist_ok=True)
-            shutil.copy(local_labels_path, dest_path)
-        except OSError as e:
-            if _is_readonly_error(e):
-                print(_readonly_message(target_root))
-                return False
-            raise
-
-        print(green("Cartridge art pack installed - your cart art will now show."))
-        return True
+        local_labels_path = fetch_labels(tmpdir, source)
+        return apply_labels(local_labels_path, target_root)
     finally:
-        if tmpdir:
-            shutil.rmtree(tmpdir, ignore_errors=True)
-
-def _zip_add_file(zipf, full_path, arcname):
-    """Add a file to the zip with a ZIP-safe timestamp. Some Analogue SD files
-    (e.g. library.db) carry a bogus/zero mtime that crashes zipfile's localtime()
-    with [Errno 22]; fall back to a valid date in that case.
-
-    compresslevel=1 is passed explicitly on the writestr call - ZipFile's own
-    constructor level doesn't reach writestr when called with a pre-built ZipInfo
-    (writestr only honors zinfo._compresslevel, which is None here, so it would
-    silently default to zlib level 6 otherwise)."""
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+def _backup_compression(compress=False):
+    """Pick (compress_type, compresslevel) for backup zips.
+
+    The card is dominated by already-compressed content (label art, save
+    states, binary saves), so the default is ZIP_STORED: pure I/O, no CPU
+    spent deflating bytes that won't shrink. `compress=True` opts back into
+    real compression for users who want smaller zips anyway - Zstandard on
+    Python 3.14+ (faster AND smaller than deflate), else deflate level 1."""
+    import zipfile
+    if not compress:
+        return zipfile.ZIP_STORED, None
+    if hasattr(zipfile, "ZIP_ZSTANDARD"):
+        return zipfile.ZIP_ZSTANDARD, 3
+    return zipfile.ZIP_DEFLATED, 1
+
+
+def _zip_info_for(entry, arcname, compress_type, compresslevel):
+    """ZipInfo for a file DirEntry, built from its cached stat.
+
+    ZipFile.write() would os.stat the file again; the scan already holds the
+    stat on the DirEntry, so one stat per file total - noticeable over
+    thousands of small label files on FAT. The compression settings go on the
+    ZipInfo because zipf.open honors only the zinfo's fields, not the ZipFile
+    constructor's. And some Analogue SD files (e.g. library.db) carry a
+    bogus/zero mtime that crashes zipfile's localtime() with [Errno 22]; fall
+    back to a valid date in that case."""
+    import zipfile
     try:
-        dt = time.localtime(os.path.getmtime(full_path))[:6]
+        st = entry.stat(follow_symlinks=False)
+        dt = time.localtime(st.st_mtime)[:6]
         if dt[0] < 1980:
             dt = (1980, 1, 1, 0, 0, 0)
     except (OSError, ValueError, OverflowError):
+        st = None
         dt = (1980, 1, 1, 0, 0, 0)
     info = zipfile.ZipInfo(arcname, date_time=dt)
-    info.compress_type = zipfile.ZIP_DEFLATED
-    with open(full_path, "rb") as f:
-        zipf.writestr(info, f.read(), compresslevel=1)
+    info.compress_type = compress_type
+    info._compresslevel = compresslevel
+    if st is not None:
+        info.file_size = st.st_size
+    return info
+
+
+def _zip_add_file(zipf, entry, arcname, compress_type, compresslevel=None, data=None):
+    """Write one file into the zip. `data` carries the bytes when a reader
+    thread already fetched them (small files); without it the file streams
+    through zipf.open with a 1 MiB buffer, keeping memory flat for the big
+    save-state files."""
+    info = _zip_info_for(entry, arcname, compress_type, compresslevel)
+    if data is not None:
+        zipf.writestr(info, data, compress_type=compress_type,
+                      compresslevel=compresslevel)
+        return
+    with open(entry.path, "rb") as src, zipf.open(info, "w", force_zip64=True) as dst:
+        shutil.copyfileobj(src, dst, length=1024 * 1024)
+
+
+_READAHEAD_SMALL = 1024 * 1024   # files up to this get read whole by the pool
+_READAHEAD_WINDOW = 8            # bounded queue: at most ~8 MiB buffered ahead
+
 
+def _scan_tree(folder_path):
+    """Walk `folder_path` with one os.scandir per directory, yielding
+    ("file", DirEntry) for every file and ("dir", path) for every empty
+    directory (so backups preserve them).
 
-def create_backup(target_root, label=None, progress=None):
+    os.walk plus the old per-directory os.listdir emptiness probe opened every
+    directory twice; a single scandir pass gives the entries and the
+    empty/non-empty classification together. Directory iteration is the slow
+    operation on FAT/exFAT SD cards, so halving it matters."""
+    try:
+        with os.scandir(folder_path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            empty = True
+            for item in _scan_tree(entry.path):
+                empty = False
+                yield item
+            if empty:
+                yield ("dir", entry.path)
+        else:
+            yield ("file", entry)
+
+
+def create_backup(target_root, label=None, progress=None, compress=False):
     """Zip Library/Settings/Memories from `target_root` into a labelled backup.
 
     `progress` is an optional callable invoked with an integer percent (0..100) as
     the backup advances, computed from bytes added to the zip. Useful for GUI
     progress bars; the CLI ignores it by default.
 
-    Compression is zlib level 1 (fastest). The Analogue 3D card is mostly already-
-    compressed content (ROM art, save states), so higher levels burn CPU for very
-    little size win - on a slow macOS exFAT mount that CPU burn is the bottleneck.
+    Backups are uncompressed (ZIP_STORED) by default: the card is mostly
+    already-compressed content (ROM art, save states), so deflate burned CPU
+    for near-zero size win - on a slow macOS exFAT mount that CPU burn was the
+    bottleneck. `compress=True` opts into light compression; see
+    _backup_compression.
     """
+    import zipfile
     print("\n=== Creating Backup ===")
     
     backup_dir = config.backup_dir("backups")
@@ -406,10 +845,15 @@ def create_backup(target_root, label=None, progress=None):
     
     folders_to_backup = []
     try:
-        for entry in os.listdir(target_root):
-            entry_path = os.path.join(target_root, entry)
-            if os.path.isdir(entry_path) and entry.lower() in {"library", "settings", "memories"}:
-                folders_to_backup.append(entry)
+        # scandir's is_dir() comes from the readdir d_type (or Windows' cached
+        # find data) - no per-entry stat, where listdir + os.path.isdir cost
+        # two syscalls for every ROM in the card root. Name check first: it's
+        # free, and skips even that for the non-matches.
+        with os.scandir(target_root) as it:
+            for entry in it:
+                if (entry.name.lower() in {"library", "settings", "memories"}
+                        and entry.is_dir(follow_symlinks=False)):
+                    folders_to_backup.append(entry.name)
     except OSError as e:
         print(yellow(f"Warning: couldn't list the SD card root ({e})."))
 
@@ -433,10 +877,10 @@ def create_backup(target_root, label=None, progress=None):
     total_bytes = 0
     if progress:
         for folder in folders_to_backup:
-            for root, _dirs, files in os.walk(os.path.join(target_root, folder)):
-                for fn in files:
+            for kind, entry in _scan_tree(os.path.join(target_root, folder)):
+                if kind == "file":
                     try:
-                        total_bytes += os.path.getsize(os.path.join(root, fn))
+                        total_bytes += entry.stat().st_size
                     except OSError:
                         pass
 
@@ -452,32 +896,58 @@ def create_backup(target_root, label=None, progress=None):
             except Exception:
                 pass  # a broken progress callback must never break the backup
 
-    with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+    compress_type, compresslevel = _backup_compression(compress)
+    # Reader threads overlap the SD card's slow reads with the writer's
+    # CRC32/compression CPU: small files are fetched ahead by the pool while
+    # the single writer (ZipFile writes are not thread-safe) appends entries
+    # in scan order. The deque caps read-ahead, so buffered bytes stay bounded;
+    # large files stream in place instead of being slurped.
+    pending = deque()
+
+    def _read_entry(entry):
+        with open(entry.path, "rb") as f:
+            return f.read()
+
+    with zipfile.ZipFile(backup_path, 'w', compress_type,
+                         compresslevel=compresslevel) as zipf, \
+            ThreadPoolExecutor(max_workers=4) as pool:
+
+        def _write_one(job):
+            nonlocal done_bytes
+            kind, entry, arcname, fut = job
+            if kind == "dir":
+                zipf.writestr(arcname, b'')
+                return
+            _zip_add_file(zipf, entry, arcname, compress_type, compresslevel,
+                          data=fut.result() if fut is not None else None)
+            if progress and total_bytes:
+                try:
+                    done_bytes += entry.stat().st_size
+                except OSError:
+                    pass
+                _emit(min(99, done_bytes * 100 // total_bytes))
+
         for folder in folders_to_backup:
             folder_path = os.path.join(target_root, folder)
-            zip_arcname = folder.replace(os.sep, '/') + '/'
-            zipf.writestr(zip_arcname, b'')
-
-            for root, dirs, files in os.walk(folder_path):
-                for d in dirs:
-                    subdir_path = os.path.join(root, d)
-                    try:
-                        if not os.listdir(subdir_path):
-                            rel = os.path.relpath(subdir_path, target_root).replace(os.sep, '/') + '/'
-                            zipf.writestr(rel, b'')
-                    except OSError:
-                        pass
-
-                for file in files:
-                    full_path = os.path.join(root, file)
-                    arcname = os.path.relpath(full_path, target_root).replace(os.sep, '/')
-                    _zip_add_file(zipf, full_path, arcname)
-                    if progress and total_bytes:
-                        try:
-                            done_bytes += os.path.getsize(full_path)
-                        except OSError:
-                            pass
-                        _emit(min(99, done_bytes * 100 // total_bytes))
+            pending.append(("dir", None, folder.replace(os.sep, '/') + '/', None))
+
+            for kind, entry in _scan_tree(folder_path):
+                if kind == "dir":  # empty directory - keep it in the archive
+                    rel = os.path.relpath(entry, target_root).replace(os.sep, '/') + '/'
+                    pending.append(("dir", None, rel, None))
+                    continue
+                arcname = os.path.relpath(entry.path, target_root).replace(os.sep, '/')
+                fut = None
+                try:
+                    if entry.stat().st_size <= _READAHEAD_SMALL:
+                        fut = pool.submit(_read_entry, entry)
+                except OSError:
+                    pass
+                pending.append(("file", entry, arcname, fut))
+                while len(pending) >= _READAHEAD_WINDOW:
+                    _write_one(pending.popleft())
+        while pending:
+            _write_one(pending.popleft())
     _emit(100)
     
     try:
@@ -516,6 +986,7 @@ def rename_backup(name, new_label):
 
 
 def restore_backup(target_root):
+    import zipfile
     print("\n=== Restore Backup ===")
     
     backup_dir = config.backup_dir("backups")